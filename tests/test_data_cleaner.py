@@ -1,7 +1,12 @@
-import pandas as pd
-import pandas.testing as pdt
+from __future__ import annotations
+
 import unittest
+
 import numpy as np
+import pytest
+
+pd = pytest.importorskip("pandas")
+import pandas.testing as pdt
 
 from src.data_cleaner import DataCleaner
 
@@ -24,21 +29,25 @@ def make_sample_df() -> pd.DataFrame:
 class TestDataCleaner(unittest.TestCase):
     """Test suite for DataCleaner class."""
 
+    @classmethod
+    def setUpClass(cls):
+        # DataCleaner never mutates its input, so the sample frame is built once.
+        cls._sample_df = make_sample_df()
+        cls.cleaner = DataCleaner()
+
     def test_example_trim_strings_with_pandas_testing(self):
-        """Ejemplo de test usando pandas.testing para comparar DataFrames completos."""
+        """Ejemplo de test usando pandas.testing para comparar la columna recortada."""
         df = pd.DataFrame({
             "name": ["  Alice  ", "  Bob  ", "Carol"],
             "age": [25, 30, 35]
         })
-        cleaner = DataCleaner()
+        cleaner = self.cleaner
         
         result = cleaner.trim_strings(df, ["name"])
         
-        expected = pd.DataFrame({
-            "name": ["Alice", "Bob", "Carol"],
-            "age": [25, 30, 35]
-        })
-        pdt.assert_frame_equal(result, expected)
+        self.assertEqual(result.shape, df.shape)
+        expected_name_series = pd.Series(["Alice", "Bob", "Carol"], name="name")
+        pdt.assert_series_equal(result["name"], expected_name_series)
 
     def test_example_drop_invalid_rows_with_pandas_testing(self):
         """Ejemplo de test usando pandas.testing para comparar Series."""
@@ -47,7 +56,7 @@ class TestDataCleaner(unittest.TestCase):
             "age": [25, 30, None],
             "city": ["SCL", "LPZ", "SCL"]
         })
-        cleaner = DataCleaner()
+        cleaner = self.cleaner
         
         result = cleaner.drop_invalid_rows(df, ["name"])
         
@@ -59,8 +68,8 @@ class TestDataCleaner(unittest.TestCase):
 
     def test_drop_invalid_rows_removes_rows_with_missing_values(self):
         """Test que verifica que drop_invalid_rows elimina filas con NaN/None."""
-        df = make_sample_df()
-        cleaner = DataCleaner()
+        df = self._sample_df
+        cleaner = self.cleaner
         
         result = cleaner.drop_invalid_rows(df, ["name", "age"])
         
@@ -68,14 +77,6 @@ class TestDataCleaner(unittest.TestCase):
         self.assertEqual(result["age"].isna().sum(), 0)
         self.assertLess(len(result), len(df))
 
-    def test_drop_invalid_rows_raises_keyerror_for_unknown_column(self):
-        """Test que verifica que lanza KeyError para columnas inexistentes."""
-        df = make_sample_df()
-        cleaner = DataCleaner()
-        
-        with self.assertRaises(KeyError):
-            cleaner.drop_invalid_rows(df, ["columna_fantasma"])
-
     def test_trim_strings_strips_whitespace_without_changing_other_columns(self):
         """Test que verifica trim_strings limpia espacios sin alterar el DF original."""
         # Se usa un DF sin nulos para evitar conflictos de tipo en esta prueba específica
@@ -83,7 +84,7 @@ class TestDataCleaner(unittest.TestCase):
             "name": [" Alice ", "Bob", " Carol  "],
             "city": ["SCL", "LPZ", "SCL"]
         })
-        cleaner = DataCleaner()
+        cleaner = self.cleaner
         
         original_value_alice = df.loc[0, "name"]
         
@@ -99,45 +100,38 @@ class TestDataCleaner(unittest.TestCase):
         # 3. Verificar otras columnas intactas
         pdt.assert_series_equal(df["city"], result["city"])
 
-    def test_trim_strings_raises_typeerror_for_non_string_column(self):
-        """Test que verifica que lanza TypeError si la columna no es string."""
-        df = make_sample_df()
-        cleaner = DataCleaner()
-        
-        with self.assertRaises(TypeError):
-            cleaner.trim_strings(df, ["age"])
-
     def test_remove_outliers_iqr_removes_extreme_values(self):
         """Test que verifica eliminación de outliers con IQR."""
         # Se usa un set de datos estadísticamente claro
         df = pd.DataFrame({
             "val": [20, 21, 19, 20, 22, 1000]
         })
-        cleaner = DataCleaner()
+        cleaner = self.cleaner
         
         result = cleaner.remove_outliers_iqr(df, "val", factor=1.5)
+        arr = result["val"].to_numpy(copy=False)
         
         # Verificar eliminación del outlier (1000)
-        self.assertNotIn(1000, result["val"].values)
+        self.assertFalse(np.isin(1000, arr).any())
         
         # Verificar conservación de valores normales
-        self.assertIn(20, result["val"].values)
-
-    def test_remove_outliers_iqr_raises_keyerror_for_missing_column(self):
-        """Test que verifica que lanza KeyError si falta la columna."""
-        df = make_sample_df()
-        cleaner = DataCleaner()
-        
-        with self.assertRaises(KeyError):
-            cleaner.remove_outliers_iqr(df, "salario_inexistente")
-
-    def test_remove_outliers_iqr_raises_typeerror_for_non_numeric_column(self):
-        """Test que verifica que lanza TypeError si la columna no es numérica."""
-        df = make_sample_df()
-        cleaner = DataCleaner()
-        
-        with self.assertRaises(TypeError):
-            cleaner.remove_outliers_iqr(df, "city")
+        self.assertTrue((arr == 20).any())
+
+    def test_methods_raise_for_invalid_columns(self):
+        """Test que verifica los errores para columnas inexistentes o de tipo incorrecto."""
+        df = self._sample_df
+        cleaner = self.cleaner
+        cases = [
+            ("drop_invalid_rows", (["columna_fantasma"],), KeyError),
+            ("trim_strings", (["age"],), TypeError),
+            ("remove_outliers_iqr", ("salario_inexistente",), KeyError),
+            ("remove_outliers_iqr", ("city",), TypeError),
+        ]
+
+        for method, args, exc in cases:
+            with self.subTest(method=method, args=args):
+                with self.assertRaises(exc):
+                    getattr(cleaner, method)(df, *args)
 
 
 if __name__ == "__main__":
@@ -5,14 +5,23 @@ import unittest
 from src.statistics_utils import StatisticsUtils
 
 
+_ARR_SMALL = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+_ARR_MMS = np.array([10.0, 20.0, 30.0, 40.0])
+_ARR_ZSC = np.array([10.0, 20.0, 30.0, 40.0, 50.0])
+
+
 class TestStatisticsUtils(unittest.TestCase):
     """Test suite for StatisticsUtils class."""
 
+    @classmethod
+    def setUpClass(cls):
+        # StatisticsUtils is stateless, so a single instance is shared.
+        cls.utils = StatisticsUtils()
+
     def test_example_moving_average_with_numpy_testing(self):
         """Ejemplo de test usando numpy.testing para comparar arrays de NumPy."""
-        utils = StatisticsUtils()
-        arr = [1.0, 2.0, 3.0, 4.0, 5.0]
-        result = utils.moving_average(arr, window=3)
+        utils = self.utils
+        result = utils.moving_average(_ARR_SMALL, window=3)
         
         # Valores esperados para media móvil con window=3
         expected = np.array([2.0, 3.0, 4.0])
@@ -22,9 +31,8 @@ class TestStatisticsUtils(unittest.TestCase):
 
     def test_example_min_max_scale_with_numpy_testing(self):
         """Ejemplo de test usando numpy.testing para verificar transformaciones numéricas."""
-        utils = StatisticsUtils()
-        arr = [10.0, 20.0, 30.0, 40.0]
-        result = utils.min_max_scale(arr)
+        utils = self.utils
+        result = utils.min_max_scale(_ARR_MMS)
         
         # Valores esperados después de min-max scaling
         expected = np.array([0.0, 1/3, 2/3, 1.0])
@@ -35,8 +43,8 @@ class TestStatisticsUtils(unittest.TestCase):
 
     def test_moving_average_basic_case(self):
         """Test que verifica que el método moving_average calcula correctamente la media móvil."""
-        utils = StatisticsUtils()
-        arr = [1, 2, 3, 4]
+        utils = self.utils
+        arr = np.array([1.0, 2.0, 3.0, 4.0])
         window = 2
         
         result = utils.moving_average(arr, window)
@@ -47,47 +55,53 @@ class TestStatisticsUtils(unittest.TestCase):
         npt.assert_allclose(result, expected)
         self.assertEqual(result.shape, (3,))
 
+    def test_moving_average_accepts_list_input(self):
+        """Test que verifica que moving_average también acepta listas de Python."""
+        utils = self.utils
+        arr = [1, 2, 3, 4]
+
+        result = utils.moving_average(arr, window=2)
+
+        npt.assert_allclose(result, np.array([1.5, 2.5, 3.5]))
+
     def test_moving_average_raises_for_invalid_window(self):
         """Test que verifica que el método lanza ValueError para ventanas inválidas."""
-        utils = StatisticsUtils()
-        arr = [1, 2, 3]
+        utils = self.utils
+        arr = np.array([1.0, 2.0, 3.0])
         
-        with self.assertRaises(ValueError):
-            utils.moving_average(arr, window=0)
-            
-        with self.assertRaises(ValueError):
-            utils.moving_average(arr, window=5)
+        for window in (0, 5):
+            with self.subTest(window=window):
+                with self.assertRaises(ValueError):
+                    utils.moving_average(arr, window=window)
 
     def test_moving_average_only_accepts_1d_sequences(self):
         """Test que verifica que lanza ValueError con secuencias multidimensionales."""
-        utils = StatisticsUtils()
-        arr_2d = [[1, 2], [3, 4]]
+        utils = self.utils
+        arr_2d = np.array([[1.0, 2.0], [3.0, 4.0]])
         
         with self.assertRaises(ValueError):
             utils.moving_average(arr_2d, window=2)
 
     def test_zscore_has_mean_zero_and_unit_std(self):
         """Test que verifica que zscore retorna media ~0 y desviación estándar ~1."""
-        utils = StatisticsUtils()
-        arr = [10, 20, 30, 40, 50]
-        
-        result = utils.zscore(arr)
+        utils = self.utils
+        result = utils.zscore(_ARR_ZSC)
         
         self.assertAlmostEqual(result.mean(), 0.0, places=7)
         self.assertAlmostEqual(result.std(), 1.0, places=7)
 
     def test_zscore_raises_for_zero_std(self):
         """Test que verifica que lanza ValueError si la desviación estándar es cero."""
-        utils = StatisticsUtils()
-        arr = [5, 5, 5]
+        utils = self.utils
+        arr = np.array([5.0, 5.0, 5.0])
         
         with self.assertRaises(ValueError):
             utils.zscore(arr)
 
     def test_min_max_scale_maps_to_zero_one_range(self):
         """Test que verifica que min_max_scale escala al rango [0, 1]."""
-        utils = StatisticsUtils()
-        arr = [2.0, 4.0, 6.0]
+        utils = self.utils
+        arr = np.array([2.0, 4.0, 6.0])
         
         result = utils.min_max_scale(arr)
         
@@ -99,8 +113,8 @@ class TestStatisticsUtils(unittest.TestCase):
 
     def test_min_max_scale_raises_for_constant_values(self):
         """Test que verifica que lanza ValueError con valores constantes."""
-        utils = StatisticsUtils()
-        arr = [3, 3, 3]
+        utils = self.utils
+        arr = np.array([3.0, 3.0, 3.0])
         
         with self.assertRaises(ValueError):
             utils.min_max_scale(arr)